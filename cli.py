@@ -1,12 +1,13 @@
 #!/usr/bin/env python3
 """LinkedIn Content Agent CLI."""
 
+import os
+import re
 import typer
 from pathlib import Path
 from typing import Optional
 from rich.console import Console
 from rich.panel import Panel
-from rich.markdown import Markdown
 
 app = typer.Typer(
     name="linkedin-agent",
@@ -15,6 +16,10 @@ app = typer.Typer(
 )
 console = Console()
 
+# Match extensions in post_analyzer.py
+_EXT_RE = re.compile(r"(?<=.)\.(md|markdown|txt|png|jpe?g|webp|heic)\Z", re.IGNORECASE)
+_TEXT_EXTS = frozenset({"md", "markdown", "txt"})
+
 
 @app.command()
 def learn(
@@ -31,18 +36,23 @@ def learn(
     if not source_path.exists():
         console.print(f"[red]Error:[/red] Directory not found: {source}")
         raise typer.Exit(1)
+    if not source_path.is_dir():
+        console.print(f"[red]Error:[/red] Not a directory: {source}")
+        raise typer.Exit(1)
 
-    text_files = list(source_path.glob("*.md")) + list(source_path.glob("*.txt"))
-    # Match extensions in post_analyzer.py (case-insensitive via both cases)
-    image_files = (
-        list(source_path.glob("*.png")) + list(source_path.glob("*.PNG")) +
-        list(source_path.glob("*.jpg")) + list(source_path.glob("*.JPG")) +
-        list(source_path.glob("*.jpeg")) + list(source_path.glob("*.JPEG")) +
-        list(source_path.glob("*.webp")) + list(source_path.glob("*.WEBP")) +
-        list(source_path.glob("*.heic")) + list(source_path.glob("*.HEIC"))
-    )
-    # Deduplicate in case filesystem is case-insensitive
-    image_files = list({f.resolve(): f for f in image_files}.values())
+    # Single directory pass; the case-insensitive regex avoids globbing each
+    # case separately and skips non-matching names without lowercasing them.
+    # scandir yields each entry once, so no dedup is needed on
+    # case-insensitive filesystems.
+    text_files = []
+    image_files = []
+    with os.scandir(source_path) as it:
+        for entry in it:
+            match = _EXT_RE.search(entry.name)
+            if not match or not entry.is_file():
+                continue
+            ext = match.group(1).lower()
+            (text_files if ext in _TEXT_EXTS else image_files).append(Path(entry.path))
 
     if not text_files and not image_files:
         console.print(f"[red]Error:[/red] No posts found in {source}")
@@ -87,9 +97,8 @@ def create(
 
     # Check if patterns exist
     store = PatternStore()
-    patterns = store.load()
 
-    if not patterns.get("patterns"):
+    if not store.has_patterns():
         console.print("[yellow]Warning:[/yellow] No patterns learned yet.")
         console.print("Run [bold]linkedin-agent learn[/bold] first to analyze posts.\n")
 
@@ -136,7 +145,6 @@ def create(
 def patterns():
     """View learned patterns."""
     from linkedin_agent.storage import PatternStore
-    import json
 
     store = PatternStore()
     data = store.load()
@@ -147,13 +155,13 @@ def patterns():
         return
 
     # Summary
-    summary = store.get_summary()
+    summary = store.get_summary(data)
     if summary:
         console.print(Panel(summary, title="Pattern Summary"))
 
     # Full patterns
     console.print("\n[bold]Full Patterns:[/bold]")
-    console.print_json(json.dumps(data["patterns"], indent=2))
+    console.print_json(data=data["patterns"])
 
 
 @app.command()
@@ -171,11 +179,11 @@ def init():
 
     for folder in folders:
         Path(folder).mkdir(exist_ok=True)
-        console.print(f"[green]Created:[/green] {folder}/")
+    console.print("\n".join(f"[green]Created:[/green] {folder}/" for folder in folders))
 
     # Create example post
     example_path = Path("creators/example.md")
-    if not example_path.exists():
+    if not os.path.isfile(example_path):
         example_content = """# Example LinkedIn Post
 
 Here's a pattern I see with successful LinkedIn posts:
@@ -196,7 +204,7 @@ What patterns have you noticed in viral posts?
 ---
 (Replace this with real posts from creators you admire)
 """
-        example_path.write_text(example_content)
+        example_path.write_text(example_content, newline="\n")
         console.print(f"[green]Created:[/green] {example_path}")
 
     console.print("\n[bold]Project initialized![/bold]")
@@ -15,6 +15,7 @@ from .tools import (
     write_post,
     load_patterns,
     generate_infographic,
+    generate_infographic_batch,
     generate_meme,
     generate_custom_image,
     edit_image,
@@ -29,7 +30,7 @@ from .tools import (
     list_carbon_themes,
 )
 from .tools.post_writer import save_patterns
-from .hooks import LoggingHook
+from .hooks import LoggingHook, ToolResultCompactionHook
 from .hub import (
     create_session_manager,
     MetricsExporter,
@@ -144,11 +145,15 @@ Available tools:
 - save_patterns: Store learned patterns
 - write_post: Save generated posts
 
-**Image Generation (3 options):**
+**Image Generation:**
 - generate_infographic: Brand-styled infographics (black/pink minimalist - automatic)
   Use for: LinkedIn posts with key points. Style is built-in, don't override.
   Example: generate_infographic(key_points=[...], title="...", topic="...")
 
+- generate_infographic_batch: Several brand-styled infographics at once
+  Use for: Carousels. Slides are generated concurrently.
+  Example: generate_infographic_batch(specs=[{"key_points": [...], "title": "..."}, ...])
+
 - generate_meme: Creative/fun images and memes
   Use for: Memes, jokes, creative visuals. Can use reference image.
   Example: generate_meme(prompt="...", reference_image="path/to/image.jpg")
@@ -174,6 +179,13 @@ To use external content: fetch with http_request, then create a post based on it
 Be helpful, creative, and focused on creating content that drives engagement."""
 
 
+_PROMPTS = {
+    "learn": LEARN_PROMPT,
+    "create": CREATE_PROMPT,
+    "chat": CHAT_PROMPT,
+}
+
+
 def create_agent(mode: str = "chat", use_hub: bool = True) -> tuple[Agent, dict]:
     """
     Create a LinkedIn Content Agent with hub integration.
@@ -185,12 +197,6 @@ def create_agent(mode: str = "chat", use_hub: bool = True) -> tuple[Agent, dict]
     Returns:
         Tuple of (Agent, hub_context dict)
     """
-    prompts = {
-        "learn": LEARN_PROMPT,
-        "create": CREATE_PROMPT,
-        "chat": CHAT_PROMPT,
-    }
-
     hub_context = {}
 
     if use_hub:
@@ -213,7 +219,7 @@ def create_agent(mode: str = "chat", use_hub: bool = True) -> tuple[Agent, dict]
 
         # Setup versioned system prompt
         prompt_manager = S3PromptManager(agent_id=AGENT_ID)
-        default_prompt = prompts.get(mode, CHAT_PROMPT)
+        default_prompt = _PROMPTS.get(mode, CHAT_PROMPT)
         prompt_manager.ensure_exists(content=default_prompt, version=PROMPT_VERSION)
         system_prompt = prompt_manager.get_current(fallback=default_prompt)
         hub_context["prompt_manager"] = prompt_manager
@@ -230,7 +236,7 @@ def create_agent(mode: str = "chat", use_hub: bool = True) -> tuple[Agent, dict]
         )
         hub_context["metrics"] = metrics
     else:
-        system_prompt = prompts.get(mode, CHAT_PROMPT)
+        system_prompt = _PROMPTS.get(mode, CHAT_PROMPT)
         session_manager = None
 
     model = anthropic_model(
@@ -244,6 +250,11 @@ def create_agent(mode: str = "chat", use_hub: bool = True) -> tuple[Agent, dict]
         should_truncate_results=True,
     )
 
+    hooks = [LoggingHook(verbose=True)]
+    if mode == "learn":
+        # Drop source posts/screenshots from history once patterns are saved
+        hooks.append(ToolResultCompactionHook())
+
     agent = Agent(
         model=model,
         system_prompt=system_prompt,
@@ -258,6 +269,7 @@ def create_agent(mode: str = "chat", use_hub: bool = True) -> tuple[Agent, dict]
             write_post,
             # Image generation
             generate_infographic,  # Brand-styled (black/pink)
+            generate_infographic_batch,  # Carousels, generated concurrently
             generate_meme,         # Creative/fun images
             generate_custom_image, # Free-form prompt
             edit_image,
@@ -274,7 +286,7 @@ def create_agent(mode: str = "chat", use_hub: bool = True) -> tuple[Agent, dict]
             http_request,
             editor,
         ],
-        hooks=[LoggingHook(verbose=True)],
+        hooks=hooks,
         session_manager=session_manager if use_hub else None,
         conversation_manager=conversation_manager,
         name=AGENT_NAME,
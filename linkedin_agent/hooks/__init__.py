@@ -3,5 +3,6 @@ Hooks - Custom hook providers for Strands agents.
 """
 
 from .logging_hook import LoggingHook
+from .compaction_hook import ToolResultCompactionHook
 
-__all__ = ["LoggingHook"]
+__all__ = ["LoggingHook", "ToolResultCompactionHook"]
@@ -0,0 +1,94 @@
+"""
+Compaction Hook - Shrink consumed tool results in the conversation history.
+"""
+
+from strands.hooks import HookProvider, HookRegistry, AfterToolCallEvent
+
+
+class ToolResultCompactionHook(HookProvider):
+    """
+    Hook that replaces large source-material results with short placeholders
+    once the agent has saved the patterns it extracted from them.
+
+    Post text from analyze_posts and batch image analyses from understand_image
+    are only needed until save_patterns succeeds; keeping them in history
+    resends them to the model on every later turn of the learn run. Intended
+    for learn mode only, where that is the whole point of the run.
+
+    Usage:
+        agent = Agent(hooks=[ToolResultCompactionHook()])
+    """
+
+    def __init__(
+        self,
+        tools: tuple[str, ...] = ("analyze_posts", "understand_image"),
+        trigger: str = "save_patterns",
+        max_chars: int = 2000,
+    ):
+        """
+        Initialize the compaction hook.
+
+        Args:
+            tools: Names of tools whose results should be compacted.
+            trigger: Tool whose successful call marks earlier results as consumed.
+            max_chars: Results at or below this size are kept as-is.
+        """
+        self.tools = frozenset(tools)
+        self.trigger = trigger
+        self.max_chars = max_chars
+
+    def register_hooks(self, registry: HookRegistry) -> None:
+        registry.add_callback(AfterToolCallEvent, self.compact)
+
+    def compact(self, event: AfterToolCallEvent) -> None:
+        if event.tool_use.get("name") != self.trigger:
+            return
+        if not isinstance(event.result, dict) or event.result.get("status") == "error":
+            return
+
+        # Map toolUseId -> toolUse so results can be matched to their tool.
+        # Only understand_image batches count; single-image analyses stay.
+        tool_uses = {}
+        for message in event.agent.messages:
+            if message["role"] != "assistant":
+                continue
+            for block in message["content"]:
+                if "toolUse" in block:
+                    tool_use = block["toolUse"]
+                    name = tool_use.get("name")
+                    if name not in self.tools:
+                        continue
+                    if name == "understand_image" and not self._image_paths(tool_use):
+                        continue
+                    tool_uses[tool_use["toolUseId"]] = tool_use
+
+        if not tool_uses:
+            return
+
+        for message in event.agent.messages:
+            if message["role"] != "user":
+                continue
+            for block in message["content"]:
+                tool_result = block.get("toolResult")
+                if not tool_result:
+                    continue
+                tool_use = tool_uses.get(tool_result["toolUseId"])
+                if tool_use is None:
+                    continue
+                size = sum(len(str(item)) for item in tool_result["content"])
+                if size <= self.max_chars:
+                    continue
+                tool_result["content"] = [{"text": self._placeholder(tool_use, size)}]
+
+    @staticmethod
+    def _image_paths(tool_use: dict) -> list:
+        return (tool_use.get("input") or {}).get("image_paths") or []
+
+    def _placeholder(self, tool_use: dict, size: int) -> str:
+        """Describe a compacted result in place of its content."""
+        image_paths = self._image_paths(tool_use)
+        if image_paths:
+            source = f"analysis of {len(image_paths)} images"
+        else:
+            source = f"{tool_use['name']} result"
+        return f"[{source} ({size} chars) removed from history after {self.trigger} succeeded]"
@@ -3,9 +3,20 @@ Logging Hook - Log tool invocations before and after execution.
 """
 
 import json
+import sys
 from strands.hooks import HookProvider, HookRegistry, BeforeToolCallEvent, AfterToolCallEvent
 
 
+def _truncate(value):
+    """Return a shortened display form of a long list or string input."""
+    value_type = type(value)
+    if value_type is str:
+        return value[:500] + "..." if len(value) > 500 else value
+    if value_type is list:
+        return f"[{len(value)} items]" if len(value) > 5 else value
+    return value
+
+
 class LoggingHook(HookProvider):
     """
     Hook that logs tool invocations before and after execution.
@@ -33,58 +44,60 @@ class LoggingHook(HookProvider):
     def log_start(self, event: BeforeToolCallEvent) -> None:
         self.tool_count += 1
         tool_name = event.tool_use.get("name", "unknown")
-        tool_input = event.tool_use.get("input", {})
 
-        print("=" * 60)
-        print(f"Tool #{self.tool_count}: {tool_name}")
-        print(f"Agent: {event.agent.name}")
+        # Collect the block and emit it with a single write
+        out = [
+            "=" * 60,
+            f"Tool #{self.tool_count}: {tool_name}",
+            f"Agent: {event.agent.name}",
+        ]
 
-        if self.verbose and tool_input:
+        tool_input = event.tool_use.get("input") if self.verbose else None
+        if tool_input:
             # Truncate long inputs (like image_paths with 47 items)
-            display_input = {}
-            for key, value in tool_input.items():
-                if isinstance(value, list) and len(value) > 5:
-                    display_input[key] = f"[{len(value)} items]"
-                elif isinstance(value, str) and len(value) > 500:
-                    display_input[key] = value[:500] + "..."
-                else:
-                    display_input[key] = value
-
-            print("Input:")
+            display_input = {key: _truncate(value) for key, value in tool_input.items()}
             formatted_input = json.dumps(display_input, indent=2)
-            for line in formatted_input.split("\n"):
-                print(f"  {line}")
+            out.append("Input:")
+            out.append("  " + formatted_input.replace("\n", "\n  "))
 
-        print("-" * 60)
+        out.append("-" * 60)
+        sys.stdout.write("\n".join(out) + "\n")
 
     def log_end(self, event: AfterToolCallEvent) -> None:
         tool_name = event.tool_use.get("name", "unknown")
         result = event.result
-
-        # Extract result content
-        result_text = None
-        is_error = False
-
-        if isinstance(result, dict):
-            content = result.get("content", [])
-            if content and isinstance(content, list):
-                for item in content:
-                    if isinstance(item, dict) and "text" in item:
-                        result_text = item["text"]
-                        break
-            # Check for error indicators
-            if "error" in str(result_text or "").lower():
-                is_error = True
-
-        # Always show errors, optionally show success
-        if is_error or self.show_results:
-            status = "❌ ERROR" if is_error else "✓ Done"
-            print(f"{status}: {tool_name}")
-
-            if result_text and (is_error or self.verbose):
-                # Truncate long results
-                if len(result_text) > 500:
-                    result_text = result_text[:500] + "..."
-                print(f"Result: {result_text}")
-
-        print("=" * 60)
+        out = []
+
+        if not isinstance(result, dict):
+            if self.show_results:
+                out.append(f"✓ Done: {tool_name}")
+        else:
+            result_text = self._extract_text(result)
+            # Tools also report failures as {"success": False, "error": ...}
+            # inside a successful result, so always check the text
+            is_error = result.get("status") == "error" or bool(
+                result_text and "error" in result_text.lower()
+            )
+            if is_error or self.show_results:
+                status = "❌ ERROR" if is_error else "✓ Done"
+                out.append(f"{status}: {tool_name}")
+
+                if result_text and (is_error or self.verbose):
+                    # Truncate long results
+                    if len(result_text) > 500:
+                        result_text = result_text[:500] + "..."
+                    out.append(f"Result: {result_text}")
+
+        out.append("=" * 60)
+        sys.stdout.write("\n".join(out) + "\n")
+
+    @staticmethod
+    def _extract_text(result: dict) -> str | None:
+        """Return the first text block of a tool result, if any."""
+        content = result.get("content")
+        if not isinstance(content, list):
+            return None
+        for item in content:
+            if isinstance(item, dict) and "text" in item:
+                return str(item["text"])
+        return None
@@ -3,6 +3,7 @@
 Supports Anthropic (Claude), Gemini, and OpenAI models.
 """
 
+import functools
 import os
 from dotenv import load_dotenv
 from strands.models.anthropic import AnthropicModel
@@ -12,6 +13,7 @@ from strands.models.openai import OpenAIModel
 load_dotenv()
 
 
+@functools.lru_cache(maxsize=8)
 def anthropic_model(
     api_key: str = os.getenv("ANTHROPIC_API_KEY"),
     model_id: str = "claude-sonnet-4-5-20250929",
@@ -34,6 +36,9 @@ def anthropic_model(
     Available models:
     - claude-sonnet-4-5-20250929: Best for creative writing (200k context)
     - claude-haiku-4-5-20251001: Fast, cost-effective (200k context)
+
+    Instances are cached per argument set so repeat calls share the same
+    client and connection pool.
     """
     if thinking:
         if budget_tokens >= max_tokens:
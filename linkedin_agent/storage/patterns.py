@@ -1,39 +1,89 @@
 """Pattern storage for learned creator styles."""
 
+import copy
 import json
+import os
+from collections.abc import Hashable
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 class PatternStore:
     """JSON-based storage for learned content patterns."""
 
     def __init__(self, storage_path: str = "patterns/patterns.json"):
         self.storage_path = Path(storage_path)
-        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        # Parsed file contents, reused while the file's mtime is unchanged
+        self._cache = None
+        self._cache_mtime = None
 
     def load(self) -> dict:
         """Load patterns from storage."""
         if not self.storage_path.exists():
             return self._empty_patterns()
+        return copy.deepcopy(self._load_cached())
 
-        with open(self.storage_path, "r") as f:
-            return json.load(f)
+    def has_patterns(self) -> bool:
+        """Check whether any patterns are stored."""
+        if not self.storage_path.exists():
+            return False
+        return bool(self._load_cached().get("patterns"))
+
+    def _load_cached(self) -> dict:
+        """Return the parsed file, reparsing only when its mtime changes.
+
+        The returned dict is shared with the cache and must not be mutated.
+        """
+        mtime = self.storage_path.stat().st_mtime_ns
+        if self._cache is not None and mtime == self._cache_mtime:
+            return self._cache
+
+        with open(self.storage_path, "rb") as f:
+            raw = f.read()
+        patterns = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
+        self._cache = patterns
+        self._cache_mtime = mtime
+        return patterns
+
+    def save(self, patterns: dict, now_iso: Optional[str] = None) -> None:
+        """Save patterns to storage.
+
+        Args:
+            patterns: Patterns dict to write.
+            now_iso: Timestamp to record as updated_at (default: now).
+        """
+        patterns["updated_at"] = now_iso or datetime.now().isoformat()
+        if HAS_ORJSON:
+            data = orjson.dumps(patterns, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(patterns, indent=2).encode("utf-8")
+        # Write to a temp file and rename over the original so an interrupted
+        # save can't leave a truncated patterns.json behind
+        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.storage_path.with_suffix(".json.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self.storage_path)
 
-    def save(self, patterns: dict) -> None:
-        """Save patterns to storage."""
-        patterns["updated_at"] = datetime.now().isoformat()
-        with open(self.storage_path, "w") as f:
-            json.dump(patterns, f, indent=2)
+        self._cache = copy.deepcopy(patterns)
+        self._cache_mtime = self.storage_path.stat().st_mtime_ns
 
     def update(self, new_patterns: dict, sources: list[str]) -> dict:
         """Update patterns with new analysis, merging with existing."""
         current = self.load()
 
         # Update metadata
-        current["updated_at"] = datetime.now().isoformat()
-        current["sources"] = list(set(current.get("sources", []) + sources))
+        now_iso = datetime.now().isoformat()
+        current["updated_at"] = now_iso
+        current["sources"] = sorted(set(current.get("sources", [])).union(sources))
 
         # Merge patterns
         if "patterns" not in current:
@@ -50,17 +100,27 @@ class PatternStore:
             else:
                 current["patterns"][key] = value
 
-        self.save(current)
+        self.save(current, now_iso=now_iso)
         return current
 
     def _merge_lists(self, existing: list, new: list) -> list:
         """Merge two lists, avoiding duplicates based on 'example' key."""
-        seen = {item.get("example") for item in existing if isinstance(item, dict)}
+        # Patterns come from JSON, so exact type checks are safe here
+        seen_examples = {item.get("example") for item in existing if type(item) is dict}
+        seen_scalars = {
+            item for item in existing
+            if type(item) is not dict and isinstance(item, Hashable)
+        }
         for item in new:
-            if isinstance(item, dict):
-                if item.get("example") not in seen:
+            if type(item) is dict:
+                example = item.get("example")
+                if example not in seen_examples:
+                    existing.append(item)
+                    seen_examples.add(example)
+            elif isinstance(item, Hashable):
+                if item not in seen_scalars:
                     existing.append(item)
-                    seen.add(item.get("example"))
+                    seen_scalars.add(item)
             elif item not in existing:
                 existing.append(item)
         return existing
@@ -69,9 +129,18 @@ class PatternStore:
         """Clear all stored patterns."""
         self.save(self._empty_patterns())
 
-    def get_summary(self) -> Optional[str]:
-        """Get a human-readable summary of stored patterns."""
-        patterns = self.load()
+    def get_summary(self, patterns: Optional[dict] = None) -> Optional[str]:
+        """Get a human-readable summary of stored patterns.
+
+        Args:
+            patterns: Already-loaded patterns to summarize. Loaded from
+                storage if not provided.
+        """
+        if patterns is None:
+            if not self.storage_path.exists():
+                return None
+            # Read-only, so the cached dict is used without copying
+            patterns = self._load_cached()
         if not patterns.get("patterns"):
             return None
 
@@ -97,10 +166,11 @@ class PatternStore:
 
     def _empty_patterns(self) -> dict:
         """Return empty pattern structure."""
+        now_iso = datetime.now().isoformat()
         return {
             "version": "1.0",
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": now_iso,
+            "updated_at": now_iso,
             "sources": [],
             "patterns": {},
         }
@@ -1,29 +1,45 @@
-"""Tools for LinkedIn Content Agent."""
-
-from .post_analyzer import analyze_posts
-from .post_writer import write_post, load_patterns
-from .image_gen import generate_infographic, edit_image, generate_meme, generate_custom_image
-from .code_formatter import format_code_snippet
-from .gemini_image_understanding import understand_image, detect_objects, segment_objects
-from .gemini_video import generate_video, generate_video_from_image, extend_video
-from .carbon_image import generate_code_image, generate_code_image_from_file, list_carbon_themes
-
-__all__ = [
-    "analyze_posts",
-    "write_post",
-    "load_patterns",
-    "generate_infographic",
-    "generate_meme",
-    "generate_custom_image",
-    "edit_image",
-    "format_code_snippet",
-    "understand_image",
-    "detect_objects",
-    "segment_objects",
-    "generate_video",
-    "generate_video_from_image",
-    "extend_video",
-    "generate_code_image",
-    "generate_code_image_from_file",
-    "list_carbon_themes",
-]
+"""Tools for LinkedIn Content Agent.
+
+Tool modules are imported on first attribute access (PEP 562), so importing
+the package doesn't pull in google-genai, Pillow, etc. until a tool that
+needs them is used.
+"""
+
+import importlib
+
+# Tool name -> submodule that defines it
+_LAZY = {
+    "analyze_posts": "post_analyzer",
+    "write_post": "post_writer",
+    "load_patterns": "post_writer",
+    "generate_infographic": "image_gen",
+    "generate_infographic_batch": "image_gen",
+    "generate_meme": "image_gen",
+    "generate_custom_image": "image_gen",
+    "edit_image": "image_gen",
+    "format_code_snippet": "code_formatter",
+    "understand_image": "gemini_image_understanding",
+    "detect_objects": "gemini_image_understanding",
+    "segment_objects": "gemini_image_understanding",
+    "generate_video": "gemini_video",
+    "generate_video_from_image": "gemini_video",
+    "extend_video": "gemini_video",
+    "generate_code_image": "carbon_image",
+    "generate_code_image_from_file": "carbon_image",
+    "list_carbon_themes": "carbon_image",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY[name]}", __name__)
+    attr = getattr(module, name)
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,9 +1,13 @@
 """Code snippet formatting tool for LinkedIn posts."""
 
+import itertools
+import time
 from pathlib import Path
-from datetime import datetime
 from strands import tool
 
+# Keeps filenames unique when several snippets are saved in one second
+_file_counter = itertools.count()
+
 
 @tool
 def format_code_snippet(
@@ -41,27 +45,23 @@ def format_code_snippet(
     # Clean up code
     code = code.strip()
 
-    # Create markdown formatted version
-    formatted = f"```{language}\n{code}\n```"
-
-    # Create LinkedIn-friendly text version
-    # LinkedIn renders backticks but no syntax highlighting
-    linkedin_text = f"```\n{code}\n```"
-
-    # Add title if provided
+    # Markdown version, and a LinkedIn-friendly text version
+    # (LinkedIn renders backticks but no syntax highlighting)
     if title:
-        formatted = f"## {title}\n\n{formatted}"
-        linkedin_text = f"{title}\n\n{linkedin_text}"
+        formatted = f"## {title}\n\n```{language}\n{code}\n```"
+        linkedin_text = f"{title}\n\n```\n{code}\n```"
+    else:
+        formatted = f"```{language}\n{code}\n```"
+        linkedin_text = f"```\n{code}\n```"
 
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"code_snippet_{timestamp}.md"
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    filename = f"code_snippet_{timestamp}_{next(_file_counter):04d}.md"
     file_path = output_path / filename
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(formatted)
+    file_path.write_text(formatted, encoding="utf-8")
 
     return {
         "success": True,
@@ -69,7 +69,7 @@ def format_code_snippet(
         "formatted": formatted,
         "linkedin_text": linkedin_text,
         "language": language,
-        "line_count": len(code.split("\n")),
+        "line_count": code.count("\n") + 1,
     }
 
 
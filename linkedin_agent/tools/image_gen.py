@@ -1,13 +1,30 @@
 """Image generation tools using Gemini."""
 
+import asyncio
+import contextlib
+import functools
+import hashlib
+import io
+import itertools
+import json
 import os
+import shutil
+import threading
+import time
+import traceback
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, List, Literal
+from types import MappingProxyType
+from typing import Callable, Iterable, Optional, List, Literal
 
 from strands import tool
 from google import genai
-from google.genai import types
+from google.genai import errors, types
+
+try:
+    from PIL import Image, ImageOps
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
 
 
 # Type definitions
@@ -20,30 +37,191 @@ DEFAULT_FOOTER = "linkedin.com/in/duanlightfoot"
 # Default model
 IMAGE_MODEL = "gemini-3-pro-image-preview"
 
+_MIME_MAP = MappingProxyType({
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+})
+
+# File extension for each image MIME type the model may return
+_EXT_MAP = MappingProxyType({
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/webp": ".webp",
+})
+
+# Map resolution to imageSize
+_SIZE_MAP = MappingProxyType({
+    "1K": "1024x1024",
+    "2K": "2048x2048",
+    "4K": "4096x4096",
+})
+
+# Brand-styled infographic prompt; filled in by _build_infographic_prompt
+_INFOGRAPHIC_TEMPLATE = """Create a minimalist technical infographic on PURE BLACK background (#000000).
+
+TITLE: {title}
+
+EXACT POINTS TO DISPLAY (use these exact words):
+{points_text}
+
+DESIGN REQUIREMENTS:
+- PURE BLACK background (#000000) - no gradients, solid black only
+- White text for main content
+- Pink/magenta (#FF1493 or similar) for accents, highlights, and numbering
+- Simple white line icons/drawings for each point
+- Clean, minimalist technical documentation style
+- Flat design - NO gradients anywhere
+- Title at top in bold white or pink
+- Each numbered point with simple icon and exact text
+- Good spacing between elements
+"""
+
+_INFOGRAPHIC_FOOTER_TEMPLATE = """
+FOOTER:
+- Thin pink/magenta line separator near bottom
+- Small LinkedIn icon (white) followed by "{footer}" in white text
+- Footer should be subtle but readable
+"""
+
+# Reference images are downscaled to this longest edge before upload
+REFERENCE_MAX_EDGE = 1024
+
+# Uploaded files expire after 48h; stop reusing them an hour early
+UPLOAD_TTL_SECONDS = 47 * 60 * 60
+_upload_cache: dict[tuple[str, str, int], tuple[types.File, float]] = {}
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Cached images live in this subdirectory of output_dir
+CACHE_DIRNAME = ".cache"
+_cache_lock = threading.Lock()
+
+_file_counter = itertools.count()
+
+
+class MissingAPIKey(RuntimeError):
+    """Raised when GOOGLE_API_KEY is not configured."""
+
+
+@functools.lru_cache(maxsize=4)
+def _client_for_key(api_key: str) -> genai.Client:
+    """Return a shared client per API key so connections are reused."""
+    return genai.Client(api_key=api_key)
+
+
+def _get_api_key() -> str:
+    """Return GOOGLE_API_KEY, raising MissingAPIKey if it is not set."""
+    api_key = os.environ.get("GOOGLE_API_KEY")
+    if not api_key:
+        raise MissingAPIKey("GOOGLE_API_KEY environment variable not set")
+    return api_key
+
+
+def _get_client() -> genai.Client:
+    """Return the shared client, raising MissingAPIKey if no key is set."""
+    return _client_for_key(_get_api_key())
+
 
 def _get_mime_type(path: Path) -> str:
     """Get MIME type from file extension."""
-    suffix = path.suffix.lower()
-    mime_map = {
-        ".png": "image/png",
-        ".jpg": "image/jpeg",
-        ".jpeg": "image/jpeg",
-        ".webp": "image/webp",
-    }
-    return mime_map.get(suffix, "image/png")
+    return _MIME_MAP.get(path.suffix.lower(), "image/png")
 
 
-def _load_image_part(image_path: str) -> types.Part:
-    """Load an image file and return a Part object."""
+def _load_image_part(image_path: str, max_edge: Optional[int] = REFERENCE_MAX_EDGE) -> types.Part:
+    """
+    Load an image file and return a Part object.
+
+    Images larger than max_edge on their longest side are downscaled before
+    upload (requires Pillow). Pass max_edge=None to send the original bytes.
+    """
     path = Path(image_path)
     if not path.exists():
         raise FileNotFoundError(f"Image file not found: {image_path}")
 
+    image_bytes, mime_type = _load_ref_bytes(
+        str(path.resolve()), path.stat().st_mtime_ns, max_edge
+    )
+    return types.Part.from_bytes(data=image_bytes, mime_type=mime_type)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_ref_bytes(abs_path: str, mtime_ns: int, max_edge: Optional[int]) -> tuple[bytes, str]:
+    """
+    Read (and optionally downscale) an image, cached per path and mtime.
+
+    Iterative edit/meme loops pass the same reference repeatedly; the mtime
+    in the key invalidates the entry when the file changes.
+    """
+    path = Path(abs_path)
     with open(path, "rb") as f:
         image_bytes = f.read()
 
     mime_type = _get_mime_type(path)
-    return types.Part.from_bytes(data=image_bytes, mime_type=mime_type)
+
+    if max_edge and HAS_PIL:
+        downscaled = _downscale(image_bytes, path.suffix.lower(), max_edge)
+        if downscaled:
+            image_bytes, mime_type = downscaled
+
+    return image_bytes, mime_type
+
+
+def _upload_image(image_path: str):
+    """
+    Return a Files API reference for an image, uploading it on first use.
+
+    Uploads are cached per API key, path and mtime (files belong to the key's
+    project) and reused until shortly before the Files API's 48h expiry, so
+    repeated edits of one image upload it once. Falls back to inline bytes if
+    the Files API has a server error; other failures propagate.
+    """
+    path = Path(image_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Image file not found: {image_path}")
+
+    api_key = _get_api_key()
+    key = (api_key, str(path.resolve()), path.stat().st_mtime_ns)
+    cached = _upload_cache.get(key)
+    if cached and time.monotonic() - cached[1] < UPLOAD_TTL_SECONDS:
+        return cached[0]
+
+    try:
+        file_ref = _client_for_key(api_key).files.upload(
+            file=str(path), config={"mime_type": _get_mime_type(path)}
+        )
+    except errors.ServerError:
+        return _load_image_part(image_path, max_edge=None)
+
+    _upload_cache[key] = (file_ref, time.monotonic())
+    return file_ref
+
+
+def _downscale(image_bytes: bytes, suffix: str, max_edge: int) -> Optional[tuple[bytes, str]]:
+    """Return (bytes, mime_type) of the image shrunk to max_edge, or None if unchanged."""
+    try:
+        img = Image.open(io.BytesIO(image_bytes))
+    except OSError:
+        # Unsupported format (e.g. HEIC without a plugin) - send as-is
+        return None
+
+    if max(img.size) <= max_edge:
+        return None
+
+    # Apply the EXIF orientation first; save() drops the tag, so phone
+    # photos would otherwise be sent sideways
+    img = ImageOps.exif_transpose(img)
+    img.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+    buf = io.BytesIO()
+    if suffix == ".png":
+        img.save(buf, format="PNG", optimize=True)
+        return buf.getvalue(), "image/png"
+
+    if img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+    img.save(buf, format="JPEG", quality=90, optimize=True)
+    return buf.getvalue(), "image/jpeg"
 
 
 def _build_generate_config(
@@ -61,13 +239,7 @@ def _build_generate_config(
     if aspect_ratio:
         image_config_kwargs["aspectRatio"] = aspect_ratio
     if resolution:
-        # Map resolution to imageSize
-        size_map = {
-            "1K": "1024x1024",
-            "2K": "2048x2048",
-            "4K": "4096x4096",
-        }
-        image_config_kwargs["imageSize"] = size_map.get(resolution, resolution)
+        image_config_kwargs["imageSize"] = _SIZE_MAP.get(resolution, resolution)
 
     if image_config_kwargs:
         config_kwargs["imageConfig"] = types.ImageConfig(**image_config_kwargs)
@@ -82,44 +254,142 @@ def _generate_and_save(
     filename_prefix: str,
     aspect_ratio: Optional[str] = None,
     resolution: Optional[str] = None,
+    use_cache: bool = False,
 ) -> dict:
     """Common generation and save logic."""
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
+    cache_key = None
+    if use_cache:
+        cache_key = _cache_key(contents, aspect_ratio, resolution)
+        cached = _cached_result(cache_key, output_dir, filename_prefix)
+        if cached:
+            return cached
+
+    config = _build_generate_config(aspect_ratio, resolution)
+
+    # Stream so image parts are written as they arrive
+    responses = client.models.generate_content_stream(
+        model=IMAGE_MODEL,
+        contents=contents,
+        config=config,
+    )
+
+    return _save_response(responses, output_dir, filename_prefix, cache_key)
+
+
+async def _generate_and_save_async(
+    client: genai.Client,
+    contents: list,
+    output_dir: str,
+    filename_prefix: str,
+    aspect_ratio: Optional[str] = None,
+    resolution: Optional[str] = None,
+    use_cache: bool = False,
+) -> dict:
+    """Async variant of _generate_and_save using the client's aio API."""
+    cache_key = None
+    if use_cache:
+        cache_key = _cache_key(contents, aspect_ratio, resolution)
+        cached = await asyncio.to_thread(_cached_result, cache_key, output_dir, filename_prefix)
+        if cached:
+            return cached
 
     config = _build_generate_config(aspect_ratio, resolution)
 
-    response = client.models.generate_content(
+    response = await client.aio.models.generate_content(
         model=IMAGE_MODEL,
         contents=contents,
         config=config,
     )
 
-    image_data = None
+    return await asyncio.to_thread(
+        _save_response, [response], output_dir, filename_prefix, cache_key
+    )
+
+
+def _new_image_path(output_dir: str, filename_prefix: str, suffix: str = ".png") -> Path:
+    """Create output_dir if needed and return a timestamped image path in it."""
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    # The counter keeps names unique when several images finish in one second
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    return output_path / f"{filename_prefix}_{timestamp}_{next(_file_counter):04d}{suffix}"
+
+
+def _write_all(f, data: bytes) -> None:
+    """Write all of data to an unbuffered file, which may write partially."""
+    view = memoryview(data)
+    while view:
+        view = view[f.write(view):]
+
+
+def _save_response(
+    responses: Iterable,
+    output_dir: str,
+    filename_prefix: str,
+    cache_key: Optional[str] = None,
+) -> dict:
+    """Write the image from generate_content response chunks to output_dir.
+
+    Image bytes are written as soon as their part arrives and the SDK's
+    reference to them is dropped, so at most one image is held in memory.
+    The file extension follows the part's MIME type; parts that claim PNG
+    (or an unknown type) must start with the PNG signature.
+    """
+    file_path = None
     text_response = None
+    signature_ok = True
 
-    if response.candidates:
-        for part in response.candidates[0].content.parts:
-            if hasattr(part, "thought") and part.thought:
+    with contextlib.ExitStack() as stack:
+        f = None
+        for response in responses:
+            if not response.candidates or not response.candidates[0].content:
                 continue
-            if hasattr(part, "inline_data") and part.inline_data:
-                image_data = part.inline_data.data
-            elif hasattr(part, "text") and part.text:
-                text_response = part.text
-
-    if not image_data:
+            for part in response.candidates[0].content.parts or []:
+                if hasattr(part, "thought") and part.thought:
+                    continue
+                if hasattr(part, "inline_data") and part.inline_data:
+                    inline_data = part.inline_data
+                    part.inline_data = None
+                    suffix = _EXT_MAP.get(inline_data.mime_type, ".png")
+                    if f is not None and file_path.suffix != suffix:
+                        # Keep the last image, as before, under its own extension
+                        f.close()
+                        file_path.unlink(missing_ok=True)
+                        f = None
+                    if f is None:
+                        file_path = _new_image_path(output_dir, filename_prefix, suffix)
+                        # Unbuffered: image bytes go straight to write(2)
+                        # instead of being copied into a BufferedWriter first
+                        f = stack.enter_context(open(file_path, "wb", buffering=0))
+                    else:
+                        # Keep the last image, as before
+                        f.seek(0)
+                        f.truncate()
+                    signature_ok = suffix != ".png" or inline_data.data.startswith(PNG_SIGNATURE)
+                    _write_all(f, inline_data.data)
+                    del inline_data
+                elif hasattr(part, "text") and part.text:
+                    # Streamed text can be split across chunks
+                    text_response = (text_response or "") + part.text
+
+    if file_path is None:
         return {
             "success": False,
             "error": "No image generated",
             "text_response": text_response,
         }
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{filename_prefix}_{timestamp}.png"
-    file_path = output_path / filename
+    if not signature_ok:
+        file_path.unlink(missing_ok=True)
+        return {
+            "success": False,
+            "error": "Generated image is not a valid PNG",
+            "text_response": text_response,
+        }
 
-    with open(file_path, "wb") as f:
-        f.write(image_data)
+    if cache_key:
+        _store_in_cache(cache_key, output_dir, file_path)
 
     return {
         "success": True,
@@ -128,6 +398,130 @@ def _generate_and_save(
     }
 
 
+# =============================================================================
+# RESPONSE CACHE - Reuse images for identical requests
+# =============================================================================
+
+def _cache_key(contents: list, aspect_ratio: Optional[str], resolution: Optional[str]) -> str:
+    """Hash the model, request contents and image settings."""
+    h = hashlib.blake2b(repr((IMAGE_MODEL, aspect_ratio, resolution)).encode(), digest_size=16)
+    for item in contents:
+        inline_data = getattr(item, "inline_data", None)
+        if inline_data is not None:
+            h.update(b"\0part\0" + (inline_data.mime_type or "").encode())
+            h.update(inline_data.data)
+        else:
+            h.update(b"\0text\0" + str(item).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _load_cache_index(cache_dir: str) -> dict:
+    """Load the key -> cached image index for a cache directory.
+
+    The parsed index is reused while index.json's mtime is unchanged, so
+    entries written by other processes are picked up. Don't mutate the result.
+    """
+    index_path = Path(cache_dir) / "index.json"
+    try:
+        mtime = index_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return _read_cache_index(str(index_path), mtime)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_cache_index(index_path: str, mtime_ns: int) -> dict:
+    """Parse an index.json, cached per path and mtime."""
+    try:
+        return json.loads(Path(index_path).read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _cached_result(cache_key: str, output_dir: str, filename_prefix: str) -> Optional[dict]:
+    """Copy a cached image to a new output file, or return None on a miss."""
+    cache_dir = Path(output_dir) / CACHE_DIRNAME
+    cached_name = _load_cache_index(str(cache_dir)).get(cache_key)
+    if not cached_name or not (cache_dir / cached_name).is_file():
+        return None
+
+    file_path = _new_image_path(output_dir, filename_prefix, Path(cached_name).suffix)
+    shutil.copyfile(cache_dir / cached_name, file_path)
+
+    return {
+        "success": True,
+        "file_path": str(file_path),
+        "message": f"Image saved to {file_path} (reused cached result)",
+        "cached": True,
+    }
+
+
+def _store_in_cache(cache_key: str, output_dir: str, file_path: Path) -> None:
+    """Keep a copy of a generated image and record it in the cache index."""
+    cache_dir = Path(output_dir) / CACHE_DIRNAME
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    cached_name = f"{cache_key}{file_path.suffix}"
+    shutil.copyfile(file_path, cache_dir / cached_name)
+
+    # Batch generation saves from several threads at once. Merge into the
+    # index as it is on disk now, so entries saved by another process since
+    # we last read it are kept, and replace it atomically.
+    with _cache_lock:
+        index = {**_load_cache_index(str(cache_dir)), cache_key: cached_name}
+        tmp_path = cache_dir / f"index.json.{os.getpid()}.tmp"
+        tmp_path.write_text(json.dumps(index, indent=2))
+        os.replace(tmp_path, cache_dir / "index.json")
+
+
+def _build_infographic_prompt(
+    key_points: List[str],
+    title: str,
+    topic: Optional[str],
+    footer: Optional[str],
+    additional_instructions: Optional[str],
+) -> str:
+    """Build the brand-styled infographic prompt."""
+    points_text = "\n".join(f"{i}. {point}" for i, point in enumerate(key_points, 1))
+
+    parts = [_INFOGRAPHIC_TEMPLATE.format(title=title, points_text=points_text)]
+    if footer:
+        parts.append(_INFOGRAPHIC_FOOTER_TEMPLATE.format(footer=footer))
+    if topic:
+        parts.append(f"- Theme/topic context: {topic}\n")
+    if additional_instructions:
+        parts.append(f"- Additional: {additional_instructions}\n")
+
+    return "".join(parts)
+
+
+def _run_image_tool(
+    filename_prefix: str,
+    build_contents: Callable[[], list],
+    aspect_ratio: Optional[str],
+    resolution: Optional[str],
+    output_dir: str,
+    use_cache: bool = False,
+) -> dict:
+    """Shared body of the image tools: client lookup, generation, error handling."""
+    try:
+        return _generate_and_save(
+            _get_client(), build_contents(), output_dir, filename_prefix,
+            aspect_ratio=aspect_ratio, resolution=resolution, use_cache=use_cache,
+        )
+    except (MissingAPIKey, FileNotFoundError) as e:
+        return {"success": False, "error": str(e)}
+    except Exception as e:
+        result = {
+            "success": False,
+            "error": str(e),
+            "error_type": type(e).__name__,
+        }
+        if os.environ.get("LINKEDIN_AGENT_DEBUG"):
+            result["traceback"] = traceback.format_exc()
+        return result
+
+
 # =============================================================================
 # INFOGRAPHIC - Brand-styled (black/pink minimalist)
 # =============================================================================
@@ -142,6 +536,7 @@ def generate_infographic(
     resolution: Optional[Resolution] = None,
     additional_instructions: Optional[str] = None,
     output_dir: str = "output",
+    use_cache: bool = True,
 ) -> dict:
     """
     Generate a brand-styled infographic (black/pink minimalist).
@@ -157,6 +552,8 @@ def generate_infographic(
         resolution: "1K", "2K", "4K" (default: auto)
         additional_instructions: Layout tweaks only, NOT styling.
         output_dir: Save directory (default: "output")
+        use_cache: Reuse the image from an identical earlier request
+                   (default: True). Set False for a fresh variation.
 
     Example:
         generate_infographic(
@@ -165,65 +562,123 @@ def generate_infographic(
             aspect_ratio="1:1"
         )
     """
-    api_key = os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        return {"success": False, "error": "GOOGLE_API_KEY environment variable not set"}
-
     if not key_points or len(key_points) == 0:
         return {"success": False, "error": "key_points is required"}
 
+    def build_contents():
+        # Build brand-styled prompt
+        return [_build_infographic_prompt(key_points, title, topic, footer, additional_instructions)]
+
+    return _run_image_tool(
+        "infographic", build_contents, aspect_ratio, resolution, output_dir,
+        use_cache=use_cache,
+    )
+
+
+# =============================================================================
+# INFOGRAPHIC BATCH - Concurrent carousel generation
+# =============================================================================
+
+async def generate_infographic_batch_async(
+    specs: List[dict],
+    concurrency: int = 5,
+    output_dir: str = "output",
+) -> List[dict]:
+    """
+    Generate several infographics concurrently, at most `concurrency` at a time.
+
+    Each spec takes the same keys as generate_infographic (key_points, title,
+    topic, footer, aspect_ratio, resolution, additional_instructions, use_cache).
+    Results are returned in spec order.
+
+    Uses its own client, closed before returning: the async HTTP pool is bound
+    to the running event loop, so the shared sync client can't be reused
+    across asyncio.run() calls.
+    """
+    client = genai.Client(api_key=_get_api_key())
     try:
-        client = genai.Client(api_key=api_key)
-        contents = []
+        return await _run_infographic_batch(client, specs, concurrency, output_dir)
+    finally:
+        await client.aio.aclose()
 
-        # Build brand-styled prompt
-        points_text = "\n".join([f"{i+1}. {point}" for i, point in enumerate(key_points)])
 
-        prompt = f"""Create a minimalist technical infographic on PURE BLACK background (#000000).
+async def _run_infographic_batch(
+    client: genai.Client,
+    specs: List[dict],
+    concurrency: int,
+    output_dir: str,
+) -> List[dict]:
+    """Fan specs out over client.aio, bounded by a semaphore."""
+    sem = asyncio.Semaphore(concurrency)
+
+    async def run(index: int, spec: dict) -> dict:
+        if not spec.get("key_points"):
+            return {"success": False, "error": "key_points is required"}
+
+        prompt = _build_infographic_prompt(
+            spec["key_points"],
+            spec.get("title", "Key Points"),
+            spec.get("topic"),
+            spec.get("footer", DEFAULT_FOOTER),
+            spec.get("additional_instructions"),
+        )
+        async with sem:
+            try:
+                return await _generate_and_save_async(
+                    client, [prompt], output_dir, f"infographic_{index:02d}",
+                    aspect_ratio=spec.get("aspect_ratio", "1:1"),
+                    resolution=spec.get("resolution"),
+                    use_cache=spec.get("use_cache", True),
+                )
+            except Exception as e:
+                return {"success": False, "error": str(e), "error_type": type(e).__name__}
 
-TITLE: {title}
+    return await asyncio.gather(*(run(i, spec) for i, spec in enumerate(specs, 1)))
 
-EXACT POINTS TO DISPLAY (use these exact words):
-{points_text}
 
-DESIGN REQUIREMENTS:
-- PURE BLACK background (#000000) - no gradients, solid black only
-- White text for main content
-- Pink/magenta (#FF1493 or similar) for accents, highlights, and numbering
-- Simple white line icons/drawings for each point
-- Clean, minimalist technical documentation style
-- Flat design - NO gradients anywhere
-- Title at top in bold white or pink
-- Each numbered point with simple icon and exact text
-- Good spacing between elements
-"""
-        if footer:
-            prompt += f"""
-FOOTER:
-- Thin pink/magenta line separator near bottom
-- Small LinkedIn icon (white) followed by "{footer}" in white text
-- Footer should be subtle but readable
-"""
-        if topic:
-            prompt += f"- Theme/topic context: {topic}\n"
-        if additional_instructions:
-            prompt += f"- Additional: {additional_instructions}\n"
+@tool
+def generate_infographic_batch(
+    specs: List[dict],
+    concurrency: int = 5,
+    output_dir: str = "output",
+) -> dict:
+    """
+    Generate multiple brand-styled infographics at once (e.g., a carousel).
 
-        contents.append(prompt)
+    Images are generated concurrently, so N slides take about as long as
+    ceil(N / concurrency) single images.
 
-        return _generate_and_save(
-            client, contents, output_dir, "infographic",
-            aspect_ratio=aspect_ratio, resolution=resolution
+    Args:
+        specs: List of dicts, one per image, with the same keys as
+               generate_infographic (key_points required; title, topic,
+               footer, aspect_ratio, resolution, additional_instructions,
+               use_cache).
+        concurrency: Max images generated at the same time (default: 5)
+        output_dir: Save directory (default: "output")
+
+    Example:
+        generate_infographic_batch(specs=[
+            {"key_points": ["Point 1", "Point 2"], "title": "Slide 1"},
+            {"key_points": ["Point 3", "Point 4"], "title": "Slide 2"},
+        ])
+    """
+    if not specs:
+        return {"success": False, "error": "specs is required"}
+
+    try:
+        results = asyncio.run(
+            generate_infographic_batch_async(specs, max(1, concurrency), output_dir)
         )
+    except MissingAPIKey as e:
+        return {"success": False, "error": str(e)}
+    failed = sum(1 for r in results if not r.get("success"))
 
-    except Exception as e:
-        import traceback
-        return {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "traceback": traceback.format_exc(),
-        }
+    return {
+        "success": failed == 0,
+        "results": results,
+        "file_paths": [r["file_path"] for r in results if r.get("success")],
+        "message": f"Generated {len(results) - failed}/{len(results)} infographics",
+    }
 
 
 # =============================================================================
@@ -258,36 +713,15 @@ def generate_meme(
             reference_image="photo.jpg"
         )
     """
-    api_key = os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        return {"success": False, "error": "GOOGLE_API_KEY environment variable not set"}
-
-    try:
-        client = genai.Client(api_key=api_key)
-        contents = []
-
+    def build_contents():
         if reference_image:
-            try:
-                contents.append(_load_image_part(reference_image))
-                contents.append(f"Using this image as reference/inspiration: {prompt}")
-            except FileNotFoundError as e:
-                return {"success": False, "error": str(e)}
-        else:
-            contents.append(prompt)
-
-        return _generate_and_save(
-            client, contents, output_dir, "meme",
-            aspect_ratio=aspect_ratio, resolution=resolution
-        )
+            return [
+                _load_image_part(reference_image),
+                f"Using this image as reference/inspiration: {prompt}",
+            ]
+        return [prompt]
 
-    except Exception as e:
-        import traceback
-        return {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "traceback": traceback.format_exc(),
-        }
+    return _run_image_tool("meme", build_contents, aspect_ratio, resolution, output_dir)
 
 
 # =============================================================================
@@ -301,6 +735,7 @@ def generate_custom_image(
     aspect_ratio: Optional[AspectRatio] = "1:1",
     resolution: Optional[Resolution] = None,
     output_dir: str = "output",
+    use_cache: bool = True,
 ) -> dict:
     """
     Generate a custom image from a free-form prompt.
@@ -313,6 +748,8 @@ def generate_custom_image(
         aspect_ratio: "1:1", "16:9", "9:16", etc. (default: "1:1")
         resolution: "1K", "2K", "4K" (default: auto)
         output_dir: Save directory (default: "output")
+        use_cache: Reuse the image from an identical earlier request
+                   (default: True). Set False for a fresh variation.
 
     Examples:
         generate_custom_image(
@@ -325,36 +762,15 @@ def generate_custom_image(
             aspect_ratio="16:9"
         )
     """
-    api_key = os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        return {"success": False, "error": "GOOGLE_API_KEY environment variable not set"}
-
-    try:
-        client = genai.Client(api_key=api_key)
-        contents = []
-
+    def build_contents():
         if reference_image:
-            try:
-                contents.append(_load_image_part(reference_image))
-                contents.append(f"Using this image as reference: {prompt}")
-            except FileNotFoundError as e:
-                return {"success": False, "error": str(e)}
-        else:
-            contents.append(prompt)
+            return [_load_image_part(reference_image), f"Using this image as reference: {prompt}"]
+        return [prompt]
 
-        return _generate_and_save(
-            client, contents, output_dir, "custom_image",
-            aspect_ratio=aspect_ratio, resolution=resolution
-        )
-
-    except Exception as e:
-        import traceback
-        return {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "traceback": traceback.format_exc(),
-        }
+    return _run_image_tool(
+        "custom_image", build_contents, aspect_ratio, resolution, output_dir,
+        use_cache=use_cache,
+    )
 
 
 # =============================================================================
@@ -393,31 +809,9 @@ def edit_image(
             prompt="Make the text bigger and add a watermark"
         )
     """
-    api_key = os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        return {"success": False, "error": "GOOGLE_API_KEY environment variable not set"}
-
-    try:
-        client = genai.Client(api_key=api_key)
-        contents = []
-
-        try:
-            contents.append(_load_image_part(image_path))
-        except FileNotFoundError as e:
-            return {"success": False, "error": str(e)}
-
-        contents.append(f"Edit this image: {prompt}")
-
-        return _generate_and_save(
-            client, contents, output_dir, "edited",
-            aspect_ratio=aspect_ratio, resolution=resolution
-        )
+    def build_contents():
+        # Full resolution via the Files API, so iterative edits of the same
+        # image don't re-send its bytes every call
+        return [_upload_image(image_path), f"Edit this image: {prompt}"]
 
-    except Exception as e:
-        import traceback
-        return {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "traceback": traceback.format_exc(),
-        }
+    return _run_image_tool("edited", build_contents, aspect_ratio, resolution, output_dir)
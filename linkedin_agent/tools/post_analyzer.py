@@ -1,9 +1,29 @@
 """Tool for analyzing LinkedIn posts and extracting patterns."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from strands import tool
 
 
+def _read_post(entry: os.DirEntry) -> dict:
+    """Read one text post into the analyze_posts result format."""
+    try:
+        content = Path(entry.path).read_text(encoding="utf-8")
+        return {
+            "filename": entry.name,
+            "content": content,
+            "length": len(content.split()),
+            "type": "text",
+        }
+    except Exception as e:
+        return {
+            "filename": entry.name,
+            "error": str(e),
+            "type": "text",
+        }
+
+
 @tool
 def analyze_posts(posts_directory: str = "creators") -> dict:
     """
@@ -35,39 +55,32 @@ def analyze_posts(posts_directory: str = "creators") -> dict:
             "count": 0,
         }
 
-    posts = []
-    images = []
     text_extensions = {".md", ".txt", ".markdown"}
     image_extensions = {".png", ".jpg", ".jpeg", ".webp", ".heic"}
 
-    for file_path in posts_path.iterdir():
-        if not file_path.is_file():
-            continue
-
-        suffix = file_path.suffix.lower()
-
-        if suffix in text_extensions:
-            try:
-                content = file_path.read_text(encoding="utf-8")
-                posts.append({
-                    "filename": file_path.name,
-                    "content": content,
-                    "length": len(content.split()),
-                    "type": "text",
-                })
-            except Exception as e:
-                posts.append({
-                    "filename": file_path.name,
-                    "error": str(e),
-                    "type": "text",
+    text_entries = []
+    images = []
+    with os.scandir(posts_path) as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+
+            suffix = os.path.splitext(entry.name)[1].lower()
+
+            if suffix in text_extensions:
+                text_entries.append(entry)
+            elif suffix in image_extensions:
+                images.append({
+                    "filename": entry.name,
+                    "path": os.path.abspath(entry.path),
+                    "type": "image",
                 })
 
-        elif suffix in image_extensions:
-            images.append({
-                "filename": file_path.name,
-                "path": str(file_path.absolute()),
-                "type": "image",
-            })
+    # File reads release the GIL, so overlap them
+    posts = []
+    if text_entries:
+        with ThreadPoolExecutor(max_workers=min(16, len(text_entries))) as executor:
+            posts = list(executor.map(_read_post, text_entries))
 
     total = len(posts) + len(images)
 
@@ -1,10 +1,26 @@
 """Tool for writing LinkedIn posts with learned patterns."""
 
-import json
+import itertools
 from pathlib import Path
 from datetime import datetime
 from strands import tool
 
+from ..storage import PatternStore
+
+# Keeps filenames unique when several posts are saved in one second
+_file_counter = itertools.count()
+
+# One store per patterns file, so its parse cache survives between calls
+_stores: dict[str, PatternStore] = {}
+
+
+def _get_store(path: Path) -> PatternStore:
+    """Return the shared PatternStore for a patterns file."""
+    key = str(path.absolute())
+    if key not in _stores:
+        _stores[key] = PatternStore(key)
+    return _stores[key]
+
 
 @tool
 def write_post(
@@ -42,20 +58,22 @@ def write_post(
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     slug = title.lower().replace(" ", "_")[:30] if title else "post"
-    filename = f"{slug}_{timestamp}.md"
+    filename = f"{slug}_{timestamp}_{next(_file_counter):04d}.md"
     file_path = output_path / filename
 
     # Save with metadata
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(f"---\n")
-        f.write(f"generated: {datetime.now().isoformat()}\n")
-        if title:
-            f.write(f"title: {title}\n")
-        f.write(f"word_count: {word_count}\n")
-        f.write(f"---\n\n")
-        f.write(content)
+    title_line = f"title: {title}\n" if title else ""
+    header = (
+        f"---\n"
+        f"generated: {now.isoformat()}\n"
+        f"{title_line}"
+        f"word_count: {word_count}\n"
+        f"---\n\n"
+    )
+    file_path.write_text(header + content, encoding="utf-8")
 
     return {
         "success": True,
@@ -91,9 +109,7 @@ def load_patterns(storage_path: str = "patterns/patterns.json") -> dict:
             "message": f"No patterns found at {path}. Run 'learn' first to analyze creator posts.",
         }
 
-    with open(path, "r") as f:
-        data = json.load(f)
-
+    data = _get_store(path).load()
     patterns = data.get("patterns", {})
 
     if not patterns:
@@ -124,23 +140,13 @@ def save_patterns(patterns: dict, storage_path: str = "patterns/patterns.json")
         dict with success status and file path
     """
     path = Path(storage_path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Load existing patterns if present
-    existing = {}
-    if path.exists():
-        with open(path, "r") as f:
-            existing = json.load(f)
-
-    # Merge patterns
-    existing["updated_at"] = datetime.now().isoformat()
-    if "patterns" not in existing:
-        existing["patterns"] = {}
+    store = _get_store(path)
 
-    existing["patterns"].update(patterns)
+    # Load existing patterns if present and merge
+    existing = store.load()
+    existing["patterns"] = {**existing.get("patterns", {}), **patterns}
 
-    with open(path, "w") as f:
-        json.dump(existing, f, indent=2)
+    store.save(existing)
 
     return {
         "success": True,